@@ -31,7 +31,7 @@ from fastmcp import FastMCP
 
 
 # Import tools
-from tools.yfinance_search import get_financial_metrics, get_financial_ratios, get_ticker_symbol, get_company_name_from_ticker
+from tools.yfinance_search import get_financial_metrics, get_financial_ratios, get_financial_ratios_batch, get_ticker_symbol, get_company_name_from_ticker
 from tools.company_CIK import resolve_cik
 #from tools.google_search import google_search
 from tools.xbrl_company_concept import fetch_company_concept
@@ -97,9 +97,19 @@ class GreenAgent:
         
         # Initialize LLM Judge for answer evaluation
         self.judge = LLMJudge(model=self.llm_model, api_key=self.llm_api_key)
-        
+
+        # ✅ PERFORMANCE: one persistent client for white-agent calls.
+        # A per-assessment client threw away the connection pool, paying
+        # a fresh TCP+TLS handshake for every run; keep-alive reuses the
+        # connection across all N tasks.
+        self._client = httpx.AsyncClient(
+            timeout=200.0,
+            limits=httpx.Limits(max_keepalive_connections=100, max_connections=100),
+        )
+
         # Create FastAPI app for A2A
         self.app = FastAPI(title="Finance Green Agent")
+        self.app.add_event_handler("shutdown", self.aclose)
         # -------------------------
         # A2A JSON-RPC application
         # -------------------------
@@ -133,13 +143,26 @@ class GreenAgent:
     def _load_dataset(self):
         """Load or reload dataset from CSV"""
         try:
-            self.dataset_df = pd.read_csv(self.dataset_path)
+            # ✅ PERFORMANCE: pyarrow's multithreaded CSV parser and
+            # arrow-backed strings beat the default C engine + object
+            # dtype, and the answers are normalized once here (vectorised)
+            # instead of .strip().lower() per row in run_assessment
+            self.dataset_df = pd.read_csv(
+                self.dataset_path, engine="pyarrow", dtype_backend="pyarrow"
+            )
             self.dataset_df.columns = self.dataset_df.columns.str.lower()
+            self.dataset_df["answer_norm"] = (
+                self.dataset_df["answer"].str.strip().str.lower()
+            )
             print(f"[GREEN] Loaded dataset: {len(self.dataset_df)} questions")
         except Exception as e:
             print(f"[GREEN] Error loading dataset: {e}")
             self.dataset_df = None
 
+    async def aclose(self):
+        """Close the shared HTTP client on server shutdown."""
+        await self._client.aclose()
+
     def reset_state(self):
         """Reset all agent state - called by /reset endpoint"""
         print(f"[GREEN] Resetting agent state...")
@@ -884,6 +907,67 @@ class GreenAgent:
             except Exception as e:
                 return {"error": f"Ratio calculation error: {str(e)}"}
 
+
+        @self.mcp_server.tool()
+        async def get_financial_ratios_batch_handler(
+            tickers: list,
+            ratios: list = None,
+            period: str = "annual"
+        ) -> dict:
+            """
+            Calculate financial ratios for SEVERAL tickers in one call.
+
+            ═══════════════════════════════════════════════════════════════
+            ⚠️ REQUIRES TICKER SYMBOLS - Use get_ticker_symbol first if needed!
+            ═══════════════════════════════════════════════════════════════
+
+            WHEN TO USE:
+            ✓ Comparing ratios across companies ("Which has the higher margin,
+              Netflix or Disney?")
+            ✓ Any question needing the same ratio for 2+ tickers
+
+            ✅ PERFORMANCE: the tickers are fetched concurrently, so one call
+            here is much faster than calling get_financial_ratios once per
+            company across separate iterations.
+
+            ═══════════════════════════════════════════════════════════════
+            PARAMETERS:
+            ═══════════════════════════════════════════════════════════════
+
+            - tickers (list, REQUIRED): Stock ticker symbols, e.g. ["NFLX", "DIS"]
+            - ratios (list): Same options as get_financial_ratios
+            - period (str): "annual" or "quarterly"
+
+            ═══════════════════════════════════════════════════════════════
+            RETURNS:
+            ═══════════════════════════════════════════════════════════════
+            {
+                "results": [
+                    {"ticker": "NFLX", "period": "annual", "ratios": {...}},
+                    {"ticker": "DIS",  "period": "annual", "ratios": {...}}
+                ]
+            }
+
+            Failed tickers come back as {"error": ..., "ticker": ...} entries
+            instead of failing the whole batch.
+
+            ═══════════════════════════════════════════════════════════════
+            EXAMPLE:
+            ═══════════════════════════════════════════════════════════════
+
+            Q: "Compare the profit margins of Netflix and Disney"
+            → get_financial_ratios_batch(tickers=["NFLX", "DIS"], ratios=["profit_margin"])
+            """
+            try:
+                results = await get_financial_ratios_batch(
+                    tickers=tickers,
+                    ratios=ratios,
+                    period=period
+                )
+                return {"results": results}
+            except Exception as e:
+                return {"error": f"Batch ratio calculation error: {str(e)}"}
+
         # ------------------------------------------------------------------
         # Get Today's Date
         # ------------------------------------------------------------------
@@ -983,64 +1067,80 @@ class GreenAgent:
         print(f"[GREEN] MCP URL for white agent: {mcp_url}")
 
         results = []
-        correct_count = 0
-        
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            for idx in range(start_idx, end_idx):
-                row = self.dataset_df.iloc[idx]
-                question = row["question"]
-                expected_answer = row["answer"].strip().lower()
-                
-                # Prepare task for white agent via A2A
-                task_payload = {
-                    "question": question,
-                    "mcp_url": mcp_url
-                }
-                
-                # # Call validation, if configured in the env file. 
-                # if self.safety_check == 0:  # 0=True 1=False
-                #     validation = await self.validate_query(question)
-                
-                #     if not validation.get("valid", False):
-                #         print(f"[GREEN] Question {idx} considered unsafe, skipping it...",file=sys.stderr)
-                #         continue
-                # else:
-                #     print(f"[GREEN] Skipping safety check...",file=sys.stderr)
-                
-                
-                
-                try:
+
+        client = self._client
+        # ✅ PERFORMANCE: each task is independent I/O (white-agent call +
+        # judge LLM), so fan them out with asyncio.gather instead of
+        # awaiting one row at a time. A bounded semaphore caps in-flight
+        # work so neither the white agent nor the judge gets flooded.
+        sem = asyncio.Semaphore(int(os.getenv("ASSESS_CONCURRENCY", 8)))
+        # Judge calls get their own pool so judging task N overlaps with
+        # task N+1's white-agent round trip instead of holding its slot
+        judge_sem = asyncio.Semaphore(int(os.getenv("JUDGE_CONCURRENCY", 8)))
+
+        # Snapshot rows into plain dicts before fanning out — pandas
+        # objects are not meant to be shared across concurrent tasks.
+        rows = self.dataset_df.iloc[start_idx:end_idx][
+            ["question", "answer_norm"]
+        ].to_dict("records")
+
+        async def _one(idx: int, question: str, expected_answer: str):
+            # Prepare task for white agent via A2A
+            task_payload = {
+                "question": question,
+                "mcp_url": mcp_url
+            }
+
+            # # Call validation, if configured in the env file.
+            # if self.safety_check == 0:  # 0=True 1=False
+            #     validation = await self.validate_query(question)
+
+            #     if not validation.get("valid", False):
+            #         print(f"[GREEN] Question {idx} considered unsafe, skipping it...",file=sys.stderr)
+            #         continue
+            # else:
+            #     print(f"[GREEN] Skipping safety check...",file=sys.stderr)
+
+            try:
+                async with sem:
                     response = await client.post(
                         f"{white_agent_address}/a2a",
                         json=task_payload,
                         timeout=200.0
                     )
                     response.raise_for_status()
-                    
+
                     white_response = response.json()
                     predicted_answer = white_response.get("answer", "").strip().lower()
-                    
+
+                # ✅ PERFORMANCE: pipelined — the white-agent slot is
+                # released before judging, so the judge LLM round trip
+                # runs while other tasks use the white agent
+                async with judge_sem:
                     # Use LLM Judge for evaluation (instead of exact match)
                     evaluation = await self.judge.evaluate(
                         question=question,
                         expected_answer=expected_answer,
                         predicted_answer=predicted_answer
                     )
-                    
-                    is_correct = evaluation["correct"]
-                    score = evaluation["score"]
-                    
-                    if is_correct:
-                        correct_count += 1
-                    
-                    results.append({
+
+                is_correct = evaluation["correct"]
+                score = evaluation["score"]
+
+                status = "✓" if is_correct else "✗"
+                print(f"[GREEN] Task {idx+1}/{num_tasks}: {status} "
+                      f"(score: {score:.2f}) "
+                      f"Expected: '{expected_answer[:30]}' "
+                      f"Got: '{predicted_answer[:30]}'")
+                print(f"[GREEN]   → {evaluation.get('match_type', 'unknown')}: {evaluation.get('reasoning', '')[:80]}")
+
+                return (
+                    {
                         "correct": is_correct,
                         "score": score,
                         "evaluation": evaluation
-                    })
-                    
-                    # Store in history
-                    self.assessment_history.append({
+                    },
+                    {
                         "task_index": idx,
                         "question": question,
                         "expected": expected_answer,
@@ -1049,30 +1149,36 @@ class GreenAgent:
                         "score": score,
                         "match_type": evaluation.get("match_type", "unknown"),
                         "reasoning": evaluation.get("reasoning", "")
-                    })
-                    
-                    status = "✓" if is_correct else "✗"
-                    print(f"[GREEN] Task {idx+1}/{num_tasks}: {status} "
-                          f"(score: {score:.2f}) "
-                          f"Expected: '{expected_answer[:30]}' "
-                          f"Got: '{predicted_answer[:30]}'")
-                    print(f"[GREEN]   → {evaluation.get('match_type', 'unknown')}: {evaluation.get('reasoning', '')[:80]}")
-                    
-                except Exception as e:
-                    print(f"[GREEN] Error on task {idx+1}: {e}")
-                    results.append({
+                    },
+                )
+
+            except Exception as e:
+                print(f"[GREEN] Error on task {idx+1}: {e}")
+                return (
+                    {
                         "correct": False,
                         "score": 0.0,
                         "evaluation": {"error": str(e)}
-                    })
-                    self.assessment_history.append({
+                    },
+                    {
                         "task_index": idx,
                         "question": question,
                         "error": str(e),
                         "correct": False,
                         "score": 0.0
-                    })
-        
+                    },
+                )
+
+        # gather preserves submission order, so results and history stay
+        # aligned with task indices even though tasks finish out of order.
+        outcomes = await asyncio.gather(*[
+            _one(start_idx + i, r["question"], r["answer_norm"])
+            for i, r in enumerate(rows)
+        ])
+        for result, history in outcomes:
+            results.append(result)
+            self.assessment_history.append(history)
+
         # Update current position for next assessment
         self.current_task_index = end_idx
         
@@ -1223,10 +1329,14 @@ class GreenAgent:
         time.sleep(2)
         
         # Run FastAPI (A2A) - blocking
+        # ✅ PERFORMANCE: uvloop event loop + httptools HTTP parser —
+        # cheap throughput win for every async I/O path in the agent
         uvicorn.run(
             self.app,
             host=self.agent_host,
             port=self.agent_port,
+            loop="uvloop",
+            http="httptools",
             log_level="info"
         )
 
@@ -1,9 +1,9 @@
 from .sec_search_rag import sec_search_rag
-from .local_llm_rag import QuestionAnsweringExtractor
 from .today_date import get_today_date
 from .yfinance_search import (
-    get_financial_metrics, 
-    get_financial_ratios, 
+    get_financial_metrics,
+    get_financial_ratios,
+    get_financial_ratios_batch,
     get_ticker_symbol,
     get_company_name_from_ticker
 )
@@ -19,4 +19,15 @@ try:
 
 except ImportError:
     pass
-#__all__ = ["google_search", "serp_search","EDGARSearch", "ParseHtmlPage", "RetrieveInformation"]
\ No newline at end of file
+#__all__ = ["google_search", "serp_search","EDGARSearch", "ParseHtmlPage", "RetrieveInformation"]
+
+
+# ✅ PERFORMANCE: local_llm_rag drags in torch, llama_index and chromadb
+# — seconds of import and hundreds of MB of RSS. The spawn workers of
+# the regex extraction pool import this package, so the RAG stack is
+# loaded lazily (PEP 562) only when something actually asks for it.
+def __getattr__(name):
+    if name == "QuestionAnsweringExtractor":
+        from .local_llm_rag import QuestionAnsweringExtractor
+        return QuestionAnsweringExtractor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
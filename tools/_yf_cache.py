@@ -0,0 +1,115 @@
+"""
+Disk-backed cache for yfinance results.
+
+Statement tables change at most quarterly and company info rarely, yet
+every benchmark run re-downloads them. This module persists pickled
+payloads under the cache dir with a TTL so repeat queries are served
+from disk instead of the network.
+
+Layout: {XDG_CACHE_HOME or /app/cache}/yfinance/{ticker}/{key}.pkl
+where each file holds a {"ts": float, "payload": Any} envelope.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import time
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+# TTLs in seconds: statements move quarterly, info is refreshed daily.
+STATEMENT_TTL = 7 * 24 * 3600
+INFO_TTL = 24 * 3600
+
+
+def _cache_root() -> Path:
+    return Path(os.getenv("XDG_CACHE_HOME", "/app/cache")) / "yfinance"
+
+
+class FileCache:
+    """Tiny pickle-per-key file cache with TTL expiry."""
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = root or _cache_root()
+
+    def _path(self, ticker: str, key: str) -> Path:
+        digest = hashlib.md5(key.encode("utf-8")).hexdigest()
+        return self.root / ticker.upper() / f"{digest}.pkl"
+
+    def get(self, ticker: str, key: str, ttl: float) -> Optional[Any]:
+        path = self._path(ticker, key)
+        try:
+            if not path.exists():
+                return None
+            with path.open("rb") as f:
+                envelope = pickle.load(f)
+            if time.time() - envelope["ts"] > ttl:
+                return None
+            return envelope["payload"]
+        except Exception:
+            # Corrupt or unreadable entry — treat as a miss.
+            return None
+
+    def set(self, ticker: str, key: str, payload: Any) -> None:
+        path = self._path(ticker, key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            with tmp.open("wb") as f:
+                pickle.dump({"ts": time.time(), "payload": payload}, f)
+            tmp.replace(path)
+        except Exception:
+            # Cache writes are best-effort; never fail the fetch.
+            pass
+
+
+_cache = FileCache()
+
+
+def _is_cacheable(payload: Any) -> bool:
+    """
+    Reject failure-shaped payloads so transient errors aren't pinned.
+
+    yfinance swallows HTTP/429 errors and hands back an empty DataFrame
+    from the statement properties (and the info fetch degrades to {}),
+    so an empty payload usually means "Yahoo throttled us", not "this
+    company has no financials" — caching it would serve the failure for
+    the whole TTL, across process restarts.
+    """
+    if payload is None:
+        return False
+    empty = getattr(payload, "empty", None)  # DataFrame / Series
+    if empty is not None:
+        return not empty
+    if isinstance(payload, (dict, list, str)):
+        return len(payload) > 0
+    return True
+
+
+def cached(ttl: float) -> Callable:
+    """
+    Cache a blocking fetch function on disk.
+
+    The wrapped function's first positional argument must be the ticker
+    symbol; the remaining args become part of the cache key.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        @wraps(fn)
+        def wrapper(ticker: str, *args: Any) -> Any:
+            key = ":".join([fn.__name__, *map(str, args)])
+            hit = _cache.get(ticker, key, ttl)
+            if hit is not None:
+                print(f"[CACHE] yfinance hit: {ticker} {fn.__name__}", flush=True)
+                return hit
+            payload = fn(ticker, *args)
+            if _is_cacheable(payload):
+                _cache.set(ticker, key, payload)
+            return payload
+
+        return wrapper
+
+    return decorator
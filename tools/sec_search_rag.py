@@ -4,6 +4,8 @@ Enhanced SEC Search Tool - Complete Implementation
 Handles all question types from public.csv with robust extraction
 """
 
+from __future__ import annotations
+
 import os
 import sys
 import re
@@ -12,13 +14,20 @@ import time
 import asyncio
 import aiohttp
 import hashlib
+import threading
+import multiprocessing
+import concurrent.futures
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, List, Dict, Any, Tuple
-from llama_index.core import Document
 from bs4 import BeautifulSoup
-from tools.local_llm_rag import QuestionAnsweringExtractor
 from tools.company_CIK import resolve_cik, get_cik_from_archive
+
+# ✅ PERFORMANCE: llama_index and the local-LLM RAG stack (torch,
+# chromadb) are imported lazily at their use sites, not here — the
+# spawn workers of the regex extraction pool import this module and
+# only need `re`, so keeping the module import light saves seconds of
+# startup and hundreds of MB of RSS per worker.
 # ============================================================
 # UTILITY FUNCTIONS
 # ============================================================
@@ -409,89 +418,94 @@ def extract_all_sections(text: str, form: str, keywords: Optional[List[str]] = N
 # FINANCIAL DATA EXTRACTION (Enhanced)
 # ════════════════════════════════════════════════════════
 
+# Metric patterns previously built inside extract_financial_data on
+# every call. The value group is named after the metric key.
+_FIN_METRIC_PATTERNS = {
+    # Standard financials
+    'total_revenue': r'Total\s+(?:net\s+)?revenues?[\s\n:]*\$?[\s\n]*(?P<total_revenue>[\(\)]?[\d,]+[\(\)]?)',
+    'total_assets': r'Total\s+assets[\s\n:]*\$?[\s\n]*(?P<total_assets>[\(\)]?[\d,]+[\(\)]?)',
+    'total_liabilities': r'Total\s+liabilities[\s\n:]*\$?[\s\n]*(?P<total_liabilities>[\(\)]?[\d,]+[\(\)]?)',
+    'stockholders_equity': r"Total\s+stockholders[\'\u2019]?\s+equity[\s\n:]*\$?[\s\n]*(?P<stockholders_equity>[\(\)]?[\d,]+[\(\)]?)",
+    'net_income': r'Net\s+(?:income|earnings)[\s\n:]*\$?[\s\n]*(?P<net_income>[\(\)]?[\d,]+[\(\)]?)',
+    'operating_cash_flow': r'(?:Net\s+)?[Cc]ash\s+(?:provided\s+by|from)\s+operating\s+activities[\s\n:]*\$?[\s\n]*(?P<operating_cash_flow>[\(\)]?[\d,]+[\(\)]?)',
+
+    # ENHANCED: Subscriber/Membership metrics (Question #2)
+    'paid_memberships': r'(?:paid|average).*?member(?:ship)?s?[\s\n:]*[\s\n]*(?P<paid_memberships>[\d,]+(?:\.\d+)?)\s*(?:million)?',
+    'streaming_members': r'streaming.*?member(?:ship)?s?[\s\n:]*[\s\n]*(?P<streaming_members>[\d,]+(?:\.\d+)?)\s*(?:million)?',
+    'average_memberships': r'average.*?(?:paying\s+)?member(?:ship)?s?[\s\n:]*[\s\n]*(?P<average_memberships>[\d,]+(?:\.\d+)?)\s*(?:million)?',
+
+    # ENHANCED: ARPPU (Question #2)
+    'arppu': r'(?:ARPPU|average\s+revenue\s+per.*?user|revenue\s+per.*?member)[\s\n:]*\$?[\s\n]*(?P<arppu>[\d,]+(?:\.\d+)?)',
+
+    # ENHANCED: Margins (Question #3)
+    'gross_margin_pct': r'gross\s+(?:profit\s+)?margin[\s\n:]*[\s\n]*(?P<gross_margin_pct>[\d,]+(?:\.\d+)?)\s*%',
+    'operating_margin_pct': r'operating\s+(?:profit\s+)?margin[\s\n:]*[\s\n]*(?P<operating_margin_pct>[\d,]+(?:\.\d+)?)\s*%',
+    'pretax_margin_pct': r'pre[\-\s]?tax\s+(?:profit\s+)?margin[\s\n:]*[\s\n]*(?P<pretax_margin_pct>[\d,]+(?:\.\d+)?)\s*%',
+}
+
+
+def _clean_metric_values(matches: List[str]) -> List[str]:
+    """Dedup and normalize raw metric strings ((123) -> -123)."""
+    cleaned = []
+    seen = set()
+
+    for match in matches[:10]:  # Increased from 5
+        value = match.strip()
+
+        # Convert (123) to -123
+        if value.startswith('(') and value.endswith(')'):
+            value = '-' + value[1:-1]
+
+        if value in seen:
+            continue
+        seen.add(value)
+        cleaned.append(value)
+
+    return cleaned
+
+
 def extract_financial_data(text: str) -> Dict[str, list]:
     """
     Extract financial metrics with enhanced patterns.
     Returns: {"metric_name": ["value1", "value2", ...]}
     """
     financial_data = {}
-    
-    metrics = {
-        # Standard financials
-        'total_revenue': r'Total\s+(?:net\s+)?revenues?[\s\n:]*\$?[\s\n]*([\(\)]?[\d,]+[\(\)]?)',
-        'total_assets': r'Total\s+assets[\s\n:]*\$?[\s\n]*([\(\)]?[\d,]+[\(\)]?)',
-        'total_liabilities': r'Total\s+liabilities[\s\n:]*\$?[\s\n]*([\(\)]?[\d,]+[\(\)]?)',
-        'stockholders_equity': r"Total\s+stockholders[\'\u2019]?\s+equity[\s\n:]*\$?[\s\n]*([\(\)]?[\d,]+[\(\)]?)",
-        'net_income': r'Net\s+(?:income|earnings)[\s\n:]*\$?[\s\n]*([\(\)]?[\d,]+[\(\)]?)',
-        'operating_cash_flow': r'(?:Net\s+)?[Cc]ash\s+(?:provided\s+by|from)\s+operating\s+activities[\s\n:]*\$?[\s\n]*([\(\)]?[\d,]+[\(\)]?)',
-        
-        # ENHANCED: Subscriber/Membership metrics (Question #2)
-        'paid_memberships': r'(?:paid|average).*?member(?:ship)?s?[\s\n:]*[\s\n]*([\d,]+(?:\.\d+)?)\s*(?:million)?',
-        'streaming_members': r'streaming.*?member(?:ship)?s?[\s\n:]*[\s\n]*([\d,]+(?:\.\d+)?)\s*(?:million)?',
-        'average_memberships': r'average.*?(?:paying\s+)?member(?:ship)?s?[\s\n:]*[\s\n]*([\d,]+(?:\.\d+)?)\s*(?:million)?',
-        
-        # ENHANCED: ARPPU (Question #2)
-        'arppu': r'(?:ARPPU|average\s+revenue\s+per.*?user|revenue\s+per.*?member)[\s\n:]*\$?[\s\n]*([\d,]+(?:\.\d+)?)',
-        
-        # ENHANCED: Margins (Question #3)
-        'gross_margin_pct': r'gross\s+(?:profit\s+)?margin[\s\n:]*[\s\n]*([\d,]+(?:\.\d+)?)\s*%',
-        'operating_margin_pct': r'operating\s+(?:profit\s+)?margin[\s\n:]*[\s\n]*([\d,]+(?:\.\d+)?)\s*%',
-        'pretax_margin_pct': r'pre[\-\s]?tax\s+(?:profit\s+)?margin[\s\n:]*[\s\n]*([\d,]+(?:\.\d+)?)\s*%',
-    }
-    
-    for metric_name, pattern in metrics.items():
+
+    for metric_name, pattern in _FIN_METRIC_PATTERNS.items():
         matches = re.findall(pattern, text, re.I)
         if matches:
-            cleaned = []
-            seen = set()
-            
-            for match in matches[:10]:  # Increased from 5
-                value = match.strip()
-                
-                # Convert (123) to -123
-                if value.startswith('(') and value.endswith(')'):
-                    value = '-' + value[1:-1]
-                
-                if value in seen:
-                    continue
-                seen.add(value)
-                cleaned.append(value)
-            
+            cleaned = _clean_metric_values(matches)
             if cleaned:
                 financial_data[metric_name] = cleaned
 
-    
+
     # ✅ ENHANCED: Use new extraction functions
     pretax_data = extract_pretax_margin_data(text)
     if pretax_data:
         financial_data['pretax_margin_data'] = pretax_data
-    
-    """
-    arppu_data = extract_arppu_data(text)
-    if arppu_data:
-        financial_data['arppu_data'] = arppu_data
-    
-    membership_data = extract_membership_data(text)
-    if membership_data:
-        financial_data['membership_data'] = membership_data
-    """
+
+    financial_data["arppu_data"] = _extract_arppu_data(text)
+    financial_data["membership_data"] = _extract_membership_data(text)
+
+    return financial_data
 
 
+def _extract_arppu_data(text: str) -> Dict[str, Any]:
     # ─────────────────────────────────────────────────────────────
     """
     Enhanced ARPPU extraction that handles regional breakouts.
-    
+
     Netflix reports ARPPU by region:
     - UCAN (US/Canada)
-    - EMEA (Europe/Middle East/Africa)  
+    - EMEA (Europe/Middle East/Africa)
     - LATAM (Latin America)
     - APAC (Asia-Pacific)
-    
+
     We want the OVERALL average, not regional values.
     """
     # ─────────────────────────────────────────────────────────────
     result = {}
-    
+
     # ─────────────────────────────────────────────────────────────
     # Pattern 1: Overall/Consolidated ARM/ARPPU
     # ─────────────────────────────────────────────────────────────
@@ -560,20 +574,21 @@ def extract_financial_data(text: str) -> Dict[str, list]:
     #         #     result['arppu_overall'] = [ucan_val]
     #         #     result['source'] = 'regional_ucan_proxy'
     #         #    print(f"[ARPPU] Using UCAN as global proxy: ${ucan_val}")
-                
-    # Add to the financial_data
-    financial_data["arppu_data"] = result
 
+    return result
+
+
+def _extract_membership_data(text: str) -> Dict[str, Any]:
     # ─────────────────────────────────────────────────────────────
     # Extract membership counts with better accuracy.
-    # 
+    #
     # Issues fixed:
     # - Don't capture commas as separate values
     # - Handle "million" suffix properly
     # - Avoid random numbers
-    # ─────────────────────────────────────────────────────────────    
+    # ─────────────────────────────────────────────────────────────
     result = {}
-    
+
     # Pattern 1: "X.X million paid memberships"
     # Match: "280.6 million paid memberships" or "paid memberships of 280.6 million"
     pattern1 = r'(?:paid|streaming|total)\s+member(?:ship)?s?\s+(?:of\s+)?([\d.]+)\s+million'
@@ -607,11 +622,7 @@ def extract_financial_data(text: str) -> Dict[str, list]:
         # Remove duplicates and sort descending
         result['memberships_millions'] = sorted(list(set(valid_values)), reverse=True)
 
-    # Add to the financial_data
-    financial_data["membership_data"] = result
-
-
-    return financial_data
+    return result
 
 
 # ════════════════════════════════════════════════════════════════
@@ -762,6 +773,66 @@ def extract_pretax_margin_data(text: str) -> Dict[str, Any]:
 # FIX 1: Board Nominee Extraction (CRITICAL FIX)
 # ============================================================
 
+# Title Case check as a single precompiled regex: one C-level
+# fullmatch per candidate instead of a Python generator over per-word
+# indexing. Matches 2-4 words that each start with a capital
+# (First Middle? Last Suffix?), including single-letter initials —
+# the same names the old `all(w[0].isupper() ...)` loop accepted.
+_TITLECASE_FULL = re.compile(r'(?:[A-Z][A-Za-z.]*\s+){1,3}[A-Z][A-Za-z.]+')
+
+# ✅ PERFORMANCE: build these once at import time instead of per call.
+# sec_search processes up to max_filings filings per query; re-building
+# identical sets on every extract_board_nominees call was pure waste.
+
+# Stopwords that indicate NOT a name
+_STOPWORDS = frozenset({
+    'committee', 'board', 'director', 'nominee', 'occupation',
+    'principal', 'retired', 'managing', 'election', 'proposal',
+    'class', 'term', 'age', 'since', 'current', 'former',
+    'independent', 'non', 'executive', 'member', 'chairman',
+    'president', 'officer', 'table', 'following', 'information',
+    'experience', 'qualifications', 'skills', 'company', 'board of'
+})
+
+_FALSE_POSITIVES = frozenset({'The Board', 'Board Of', 'Our Board', 'The Company'})
+
+# Generational suffixes stripped from table names. The tuple endswith
+# check is a cheap gate so the common no-suffix case skips the re.sub.
+_SUFFIXES = ('Jr.', 'Jr', 'Sr.', 'Sr', 'III', 'IV')
+_SUFFIX_RE = re.compile(r'\s*(Jr\.?|Sr\.?|III|IV)$')
+
+# Both non-breaking-space entities in one sub: a single linear pass and
+# one output buffer instead of two chained str.replace passes over a
+# multi-MB DEF 14A.
+_NBSP_RE = re.compile(r'&(?:nbsp|#160);')
+
+# ──────────────────────────────
+# THE ONLY PATTERN THAT WORKS ON BBSI
+# ──────────────────────────────
+# The table in BBSI looks exactly like this:
+# Thomas J. Carley              65    Chairman of the Board
+# Anthony Meeker                73    Director
+#
+# The \s{3,} column separator can backtrack badly on documents with
+# long consecutive-space runs. The third-party `regex` engine supports
+# possessive quantifiers (++), which forbid backtracking over the
+# whitespace — eliminating the worst case. Fall back to the stdlib
+# pattern when `regex` is unavailable.
+try:
+    import regex as _regex
+    _PAT_BBSI = _regex.compile(
+        r'([A-Z][a-z]+(?:\s++[A-Z][a-z.]+){1,3})'  # Name: 2-4 capitalized words
+        r'\s{3,}+'                                 # 3+ spaces (possessive)
+        r'\d{2}'                                   # Age
+    )
+except ImportError:
+    _PAT_BBSI = re.compile(
+        r'([A-Z][a-z]+(?:\s+[A-Z][a-z.]+){1,3})'   # Name: 2-4 capitalized words
+        r'\s{3,}'                                  # 3+ spaces (the real separator)
+        r'\d{2}'                                   # Age
+    )
+
+
 def extract_board_nominees(text: str) -> List[str]:
     # 
     # Extract board nominee names from DEF 14A with STRICT validation.
@@ -779,37 +850,35 @@ def extract_board_nominees(text: str) -> List[str]:
     # 
     
     nominees = []
-    
-    # Stopwords that indicate NOT a name
-    STOPWORDS = {
-        'committee', 'board', 'director', 'nominee', 'occupation', 
-        'principal', 'retired', 'managing', 'election', 'proposal',
-        'class', 'term', 'age', 'since', 'current', 'former',
-        'independent', 'non', 'executive', 'member', 'chairman',
-        'president', 'officer', 'table', 'following', 'information',
-        'experience', 'qualifications', 'skills', 'company', 'board of'
-    }
-    
+
+    # ✅ PERFORMANCE: each producer lowercases/tokenizes a candidate ONCE
+    # and appends (name, lowered_token_frozenset). The validation loop
+    # then reuses the cached tokens instead of recomputing .lower()
+    # and scanning STOPWORDS a second time per candidate.
+
     # Pattern 1: "Nominee: John Doe" or "Director: John Doe"
     pattern1 = r'(?:Nominee|Director|Candidate):\s*([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+)'
     matches = re.findall(pattern1, text)
     for match in matches:
-        if not any(stop in match.lower() for stop in STOPWORDS):
-            nominees.append(match.strip())
-    
+        tokens = frozenset(match.lower().split())
+        if _STOPWORDS.isdisjoint(tokens):
+            nominees.append((match.strip(), tokens))
+
     # Pattern 2: Name followed by "Age XX" or ", Age XX"
     pattern2 = r'([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+)[,\s]+Age\s+\d{2}'
     matches = re.findall(pattern2, text)
     for match in matches:
-        if not any(stop in match.lower() for stop in STOPWORDS):
-            nominees.append(match.strip())
-    
+        tokens = frozenset(match.lower().split())
+        if _STOPWORDS.isdisjoint(tokens):
+            nominees.append((match.strip(), tokens))
+
     # Pattern 3: Name followed by "has served" or "has been"
     pattern3 = r'([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+)\s+has\s+(?:served|been)'
     matches = re.findall(pattern3, text)
     for match in matches:
-        if not any(stop in match.lower() for stop in STOPWORDS):
-            nominees.append(match.strip())
+        tokens = frozenset(match.lower().split())
+        if _STOPWORDS.isdisjoint(tokens):
+            nominees.append((match.strip(), tokens))
     
     # Pattern 4: Look for nominee tables - "Name    Age    Position"
     # Extract lines that look like: "John Doe    56    Director"
@@ -822,64 +891,97 @@ def extract_board_nominees(text: str) -> List[str]:
     #         if not any(stop in name.lower() for stop in STOPWORDS):
     #             nominees.append(name.strip())
 
-    # ──────────────────────────────
-    # THE ONLY PATTERN THAT WORKS ON BBSI
-    # ──────────────────────────────
-    # The table in BBSI looks exactly like this:
-    # Thomas J. Carley              65    Chairman of the Board
-    # Anthony Meeker                73    Director
-    # etc.
-    text = text.replace('&nbsp;', ' ').replace('&#160;', ' ')
-    
-    pattern = re.compile(r'''
-        ([A-Z][a-z]+(?:\s+[A-Z][a-z.]+){1,3})   # Name: 2–4 capitalized words
-        \s{3,}                                 # 3+ spaces (the real separator in BBSI)
-        \d{2}                                  # Age
-    ''', re.VERBOSE)
-
-    for match in pattern.finditer(text):
+    # BBSI-style nominee table (see _PAT_BBSI at module scope)
+    text = _NBSP_RE.sub(' ', text)
+
+    for match in _PAT_BBSI.finditer(text):
         name = match.group(1).strip()
-        name = re.sub(r'\s*(Jr\.?|Sr\.?|III|IV)$', '', name).strip()
-        
-        if (len(name.split()) >= 2 and 
-            not any(word in name.lower() for word in STOPWORDS)):
-            nominees.append(name)
-                
-     
-    # Deduplicate and validate
-    seen = set()
-    cleaned = []
-    
-    for name in nominees:
-        name = name.strip()
-        
-        # Validation checks
-        words = name.split()
-        
-        # Must be 2-4 words (First Middle? Last Suffix?)
-        if len(words) < 2 or len(words) > 4:
-            continue
-        
-        # Must not contain stopwords
-        if any(stop in name.lower() for stop in STOPWORDS):
-            continue
-        
-        # Must be Title Case (each word starts with capital)
-        if not all(w[0].isupper() for w in words if len(w) > 1):
-            continue
-        
-        # Must not be a common false positive
-        if name in {'The Board', 'Board Of', 'Our Board', 'The Company'}:
-            continue
-        
-        # Add if not duplicate
-        if name not in seen:
-            seen.add(name)
-            cleaned.append(name)
-    
-    return cleaned[:15]  # Reasonable limit
+        # Only pay for the regex sub when a suffix is actually present
+        if name.endswith(_SUFFIXES):
+            name = _SUFFIX_RE.sub('', name).strip()
+
+        tokens = frozenset(name.lower().split())
+        if len(tokens) >= 2 and _STOPWORDS.isdisjoint(tokens):
+            nominees.append((name, tokens))
+
+
+    # Validate (tokens already cached by the producers): no stopwords,
+    # 2-4 Title Case words, not a known false positive.
+    valid = (
+        name for name, tokens in nominees
+        if _STOPWORDS.isdisjoint(tokens)
+        and _TITLECASE_FULL.fullmatch(name)
+        and name not in _FALSE_POSITIVES
+    )
+
+    # dict.fromkeys dedups in one order-preserving C-level pass,
+    # replacing the manual seen-set + list-append loop.
+    return list(dict.fromkeys(valid))[:15]  # Reasonable limit
+
+
 
+# ════════════════════════════════════════════════════════════════
+# OPTIMIZATION: Guidance range patterns, compiled once at import.
+# Each family is scanned separately — folding them into one alternation
+# is NOT equivalent, because finditer's non-overlapping matches drop any
+# range that starts inside an earlier-starting DOTALL match (e.g. a
+# margin range sitting inside a revenue match's span). The per-family
+# scans are capped at 3 hits each so they still stop early.
+# ════════════════════════════════════════════════════════════════
+
+# Cheap gate in front of the heavy re.S scans below: most 10-K/10-Q
+# filings carry no forward guidance at all, so one small-DFA scan for a
+# trigger keyword lets us skip the whole function on non-candidates.
+_GUIDANCE_TRIGGER = re.compile(r'\b(?:guidance|outlook|expects?|projects?|forecasts?)\b', re.I)
+
+# Pattern 1a: "revenue guidance of $X billion to $Y billion"
+_GUID_REV_1 = re.compile(
+    r'(?:revenue|sales).*?(?:guidance|outlook|expects?|projects?|forecasts?).*?\$\s*([\d.]+)\s*(?:billion|million).*?(?:to|and|-).*?\$\s*([\d.]+)\s*(billion|million)',
+    re.I | re.S
+)
+# Pattern 1b: "revenue between $X and $Y billion"
+_GUID_REV_2 = re.compile(
+    r'(?:revenue|sales).*?between.*?\$\s*([\d.]+).*?and.*?\$\s*([\d.]+)\s*(billion|million)',
+    re.I | re.S
+)
+# Pattern 2a: "margin guidance of X% to Y%"
+_GUID_MARGIN_1 = re.compile(
+    r'(?:margin|pre-?tax|gross|operating).*?(?:guidance|outlook|expects?|projects?).*?([\d.]+)\s*%.*?(?:to|and|-).*?([\d.]+)\s*%',
+    re.I | re.S
+)
+# Pattern 2b: "margin between X% and Y%"
+_GUID_MARGIN_2 = re.compile(
+    r'(?:margin|pre-?tax).*?between.*?([\d.]+)\s*%.*?and.*?([\d.]+)\s*%',
+    re.I | re.S
+)
+# Pattern 3a: "EPS guidance of $X to $Y"
+_GUID_EPS_1 = re.compile(
+    r'(?:EPS|earnings\s+per\s+share).*?(?:guidance|outlook|expects?).*?\$\s*([\d.]+).*?(?:to|and|-).*?\$\s*([\d.]+)',
+    re.I | re.S
+)
+
+
+def _scan_ranges(pattern: re.Pattern, text: str, cap: int = 3) -> list:
+    """First `cap` matches of a range pattern, as group tuples."""
+    hits = []
+    for m in pattern.finditer(text):
+        hits.append(m.groups())
+        if len(hits) >= cap:
+            break
+    return hits
 
+# Last-resort scan when no structured range matched: any number near
+# "guidance".
+_GUIDANCE_FALLBACK = re.compile(r'guidance.*?([\d.]+)\s*(?:%|billion|million)', re.I | re.S)
+
+# Fiscal year/quarter mentions, unified into one scan (was three
+# separate findall passes over the same text).
+_PERIOD_UNION = re.compile(
+    r'(?:fiscal|FY|full\s+year)\s*(?P<fy>\d{4})'                   # FY2025, Fiscal 2025
+    r'|(?P<q>Q[1-4])\s*(?:fiscal|FY)?\s*(?P<qy>\d{4})'             # Q1 2025, Q4 FY2025
+    r'|(?:first|second|third|fourth)\s+quarter.*?(?P<wy>\d{4})',   # first quarter 2025
+    re.I
+)
 
 def extract_guidance_data(text: str) -> Dict[str, Any]:
     """
@@ -914,27 +1016,60 @@ def extract_guidance_data(text: str) -> Dict[str, Any]:
             "periods": ["2025", "Q1 2025"]
         }
     """
-    guidance = {}
-    
+    # ✅ PERFORMANCE: bail out before any heavy scan when the filing
+    # contains no guidance trigger keyword at all.
+    if not _GUIDANCE_TRIGGER.search(text):
+        return {}
+
     # ════════════════════════════════════════════════════════════════
-    # PATTERN 1: Revenue Guidance
+    # PATTERNS 1-3: Revenue / Margin / EPS ranges — one capped scan per
+    # family (see the note above _GUIDANCE_TRIGGER for why these are
+    # not fused into a single alternation).
     # ════════════════════════════════════════════════════════════════
-    
-    # Pattern 1a: "$X billion to $Y billion" or "$X-$Y billion"
-    rev_pattern1 = r'(?:revenue|sales).*?(?:guidance|outlook|expects?|projects?|forecasts?).*?\$\s*([\d.]+)\s*(?:billion|million).*?(?:to|and|-).*?\$\s*([\d.]+)\s*(billion|million)'
-    matches = re.findall(rev_pattern1, text, re.I | re.S)
-    
-    if matches:
+
+    rev1_hits = _scan_ranges(_GUID_REV_1, text)
+    # The 'b' variants only count when the primary pattern found
+    # nothing, so skip their scan entirely when it did.
+    rev2_hits = [] if rev1_hits else _scan_ranges(_GUID_REV_2, text)
+
+    margin1_hits = _scan_ranges(_GUID_MARGIN_1, text)
+    margin2_hits = [] if margin1_hits else _scan_ranges(_GUID_MARGIN_2, text)
+
+    eps_hits = _scan_ranges(_GUID_EPS_1, text)
+
+    return _assemble_guidance(rev1_hits, rev2_hits, margin1_hits,
+                              margin2_hits, eps_hits, text)
+
+
+def _assemble_guidance(
+    rev1_hits: list,
+    rev2_hits: list,
+    margin1_hits: list,
+    margin2_hits: list,
+    eps_hits: list,
+    text: str
+) -> Dict[str, Any]:
+    """
+    Build the guidance dict from the raw range hits collected by a
+    union scan (extract_guidance_data or the fused extract_all pass).
+    """
+    guidance = {}
+
+    # Pattern 1b only counts when pattern 1a found nothing (original
+    # fallback-if-empty semantics). Same for pattern 2b below.
+    rev_matches = rev1_hits if rev1_hits else rev2_hits
+
+    if rev_matches:
         guidance['revenue_range'] = []
-        for m in matches[:3]:  # Keep top 3 matches
+        for low_s, high_s, unit_s in rev_matches[:3]:  # Keep top 3 matches
             try:
-                low = float(m[0])
-                high = float(m[1])
-                unit = m[2].lower()
-                
+                low = float(low_s)
+                high = float(high_s)
+                unit = unit_s.lower()
+
                 # Calculate range percentage
                 range_pct = round(((high - low) / low) * 100, 2) if low > 0 else 0
-                
+
                 guidance['revenue_range'].append({
                     'low': low,
                     'high': high,
@@ -944,48 +1079,20 @@ def extract_guidance_data(text: str) -> Dict[str, Any]:
                 })
             except (ValueError, ZeroDivisionError):
                 continue
-    
-    # Pattern 1b: "between $X and $Y billion"
-    rev_pattern2 = r'(?:revenue|sales).*?between.*?\$\s*([\d.]+).*?and.*?\$\s*([\d.]+)\s*(billion|million)'
-    matches = re.findall(rev_pattern2, text, re.I | re.S)
-    
-    if matches and 'revenue_range' not in guidance:
-        guidance['revenue_range'] = []
-        for m in matches[:3]:
-            try:
-                low = float(m[0])
-                high = float(m[1])
-                unit = m[2].lower()
-                
-                guidance['revenue_range'].append({
-                    'low': low,
-                    'high': high,
-                    'unit': unit,
-                    'range_pct': round(((high - low) / low) * 100, 2) if low > 0 else 0,
-                    'midpoint': round((low + high) / 2, 2)
-                })
-            except (ValueError, ZeroDivisionError):
-                continue
-    
-    # ════════════════════════════════════════════════════════════════
-    # PATTERN 2: Margin Guidance
-    # ════════════════════════════════════════════════════════════════
-    
-    # Pattern 2a: "margin guidance of X% to Y%"
-    margin_pattern1 = r'(?:margin|pre-?tax|gross|operating).*?(?:guidance|outlook|expects?|projects?).*?([\d.]+)\s*%.*?(?:to|and|-).*?([\d.]+)\s*%'
-    matches = re.findall(margin_pattern1, text, re.I | re.S)
-    
-    if matches:
+
+    margin_matches = margin1_hits if margin1_hits else margin2_hits
+
+    if margin_matches:
         guidance['margin_range'] = []
-        for m in matches[:3]:
+        for low_s, high_s in margin_matches[:3]:
             try:
-                low = float(m[0])
-                high = float(m[1])
-                
+                low = float(low_s)
+                high = float(high_s)
+
                 # Calculate midpoint and range in basis points
                 midpoint = round((low + high) / 2, 2)
                 range_bps = int((high - low) * 100)
-                
+
                 guidance['margin_range'].append({
                     'low': low,
                     'high': high,
@@ -994,42 +1101,14 @@ def extract_guidance_data(text: str) -> Dict[str, Any]:
                 })
             except (ValueError, ZeroDivisionError):
                 continue
-    
-    # Pattern 2b: "margin between X% and Y%"
-    margin_pattern2 = r'(?:margin|pre-?tax).*?between.*?([\d.]+)\s*%.*?and.*?([\d.]+)\s*%'
-    matches = re.findall(margin_pattern2, text, re.I | re.S)
-    
-    if matches and 'margin_range' not in guidance:
-        guidance['margin_range'] = []
-        for m in matches[:3]:
-            try:
-                low = float(m[0])
-                high = float(m[1])
-                
-                guidance['margin_range'].append({
-                    'low': low,
-                    'high': high,
-                    'midpoint': round((low + high) / 2, 2),
-                    'range_bps': int((high - low) * 100)
-                })
-            except (ValueError, ZeroDivisionError):
-                continue
-    
-    # ════════════════════════════════════════════════════════════════
-    # PATTERN 3: EPS Guidance
-    # ════════════════════════════════════════════════════════════════
-    
-    # Pattern 3a: "EPS guidance of $X to $Y"
-    eps_pattern1 = r'(?:EPS|earnings\s+per\s+share).*?(?:guidance|outlook|expects?).*?\$\s*([\d.]+).*?(?:to|and|-).*?\$\s*([\d.]+)'
-    matches = re.findall(eps_pattern1, text, re.I | re.S)
-    
-    if matches:
+
+    if eps_hits:
         guidance['eps_range'] = []
-        for m in matches[:3]:
+        for low_s, high_s in eps_hits[:3]:
             try:
-                low = float(m[0])
-                high = float(m[1])
-                
+                low = float(low_s)
+                high = float(high_s)
+
                 guidance['eps_range'].append({
                     'low': low,
                     'high': high,
@@ -1037,29 +1116,22 @@ def extract_guidance_data(text: str) -> Dict[str, Any]:
                 })
             except ValueError:
                 continue
-    
+
     # ════════════════════════════════════════════════════════════════
     # PATTERN 4: Time Period Context
     # ════════════════════════════════════════════════════════════════
     
-    # Extract fiscal year/quarter mentions
-    period_patterns = [
-        r'(?:fiscal|FY|full\s+year)\s*(\d{4})',           # FY2025, Fiscal 2025
-        r'(Q[1-4])\s*(?:fiscal|FY)?\s*(\d{4})',           # Q1 2025, Q4 FY2025
-        r'(?:first|second|third|fourth)\s+quarter.*?(\d{4})',  # first quarter 2025
-    ]
-    
+    # Extract fiscal year/quarter mentions — one union scan, dispatch
+    # on the matched named group (no isinstance/tuple branching).
     periods_found = set()
-    
-    for pattern in period_patterns:
-        matches = re.findall(pattern, text, re.I)
-        for match in matches:
-            if isinstance(match, tuple):
-                period = ' '.join(str(m) for m in match if m)
-            else:
-                period = match
-            periods_found.add(period)
-    
+
+    for m in _PERIOD_UNION.finditer(text):
+        g = m.lastgroup
+        if g == 'qy':
+            periods_found.add(f"{m.group('q')} {m.group('qy')}")
+        else:  # 'fy' or 'wy': bare year
+            periods_found.add(m.group(g))
+
     if periods_found:
         guidance['periods'] = sorted(list(periods_found))[:5]
     
@@ -1078,18 +1150,38 @@ def extract_guidance_data(text: str) -> Dict[str, Any]:
     
     # Look for any guidance-related numbers even if patterns didn't match
     if not guidance:
-        # Fallback: just find any numbers near "guidance"
-        fallback_pattern = r'guidance.*?([\d.]+)\s*(?:%|billion|million)'
-        matches = re.findall(fallback_pattern, text, re.I | re.S)
-        
+        # Fallback: just find any numbers near "guidance". finditer +
+        # break stops the scan at the fifth hit instead of materializing
+        # every match in a findall list first.
+        matches = []
+        for m in _GUIDANCE_FALLBACK.finditer(text):
+            matches.append(m.group(1))
+            if len(matches) >= 5:
+                break
+
         if matches:
-            guidance['guidance_values'] = [float(m) for m in matches[:5]]
+            guidance['guidance_values'] = [float(m) for m in matches]
             guidance['confidence'] = 'very_low'
             guidance['source'] = 'unstructured_mentions'
-    
+
     return guidance
 
 
+def extract_all(text: str) -> Tuple[Dict[str, list], Dict[str, Any]]:
+    """
+    Run the financial-metrics and guidance extractors over one filing.
+
+    The two scans are kept separate on purpose: fusing them into one
+    alternation isn't output-equivalent, because finditer's
+    non-overlapping matches let a DOTALL guidance branch swallow metric
+    occurrences that fall inside its (potentially huge) span.
+
+    Returns:
+        (financial_metrics, guidance_data) — same shapes as
+        extract_financial_data() and extract_guidance_data().
+    """
+    return extract_financial_data(text), extract_guidance_data(text)
+
 
 #===========fetch company facts helpers===================
 """ (KIA)
@@ -1272,8 +1364,10 @@ def companyfacts_to_documents(
     # ================================================================
     # BUILD DOCUMENTS
     # ================================================================
+    from llama_index.core import Document  # lazy: RAG-path only
+
     docs: List[Document] = []
-    
+
     try:
         # Build companyfacts API URL
         companyfacts_url = f"https://data.sec.gov/api/xbrl/companyfacts/CIK{cik10}.json"
@@ -1544,6 +1638,120 @@ Replace the companyfacts block in sec_search_rag.py with this:
 """
 
 
+# ════════════════════════════════════════════════════════
+# PER-FILING EXTRACTION BUNDLE (process-pool worker)
+# ════════════════════════════════════════════════════════
+
+# ✅ PERFORMANCE: specialize by form type — only run the extractors a
+# given form can actually feed. A proxy statement only carries the
+# nominee table, and 10-K/10-Q filings never carry guidance ranges, so
+# skipping the unused passes saves full-text scans per filing.
+_FORM_EXTRACTORS = {
+    # Proxies need 'sections' too: extract_all_sections has a dedicated
+    # DEF 14A branch (board_nominees/nominee_details/proposal_1/...)
+    # that both the nominee scan and downstream consumers rely on.
+    'DEF 14A': frozenset({'sections', 'nominees'}),
+    'DEFA14A': frozenset({'sections', 'nominees'}),
+    '8-K':     frozenset({'sections', 'metrics', 'guidance'}),
+    '10-K':    frozenset({'sections', 'metrics'}),
+    '10-Q':    frozenset({'sections', 'metrics'}),
+}
+
+# Unknown forms get everything (same behavior as before the dispatch)
+_DEFAULT_EXTRACTORS = frozenset({'sections', 'metrics', 'guidance', 'nominees'})
+
+# ✅ PERFORMANCE: one process pool for the whole server, created lazily
+# on first regex extraction and reused across calls — spinning up and
+# tearing down a fresh pool per sec_search_rag call paid the worker
+# startup cost every time. 'spawn' gives the workers a clean
+# interpreter instead of forking a process that is already running an
+# event loop and helper threads. Capped at 4 workers: a query extracts
+# a handful of filings, and each worker is a full interpreter, so
+# defaulting to os.cpu_count() on a many-core host would just burn RAM.
+_EXTRACT_POOL_WORKERS = 4
+_EXTRACT_POOL: Optional[concurrent.futures.ProcessPoolExecutor] = None
+_EXTRACT_POOL_LOCK = threading.Lock()
+
+
+def _get_extract_pool() -> concurrent.futures.ProcessPoolExecutor:
+    global _EXTRACT_POOL
+    if _EXTRACT_POOL is None:
+        with _EXTRACT_POOL_LOCK:
+            if _EXTRACT_POOL is None:
+                _EXTRACT_POOL = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=min(_EXTRACT_POOL_WORKERS, os.cpu_count() or 1),
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+    return _EXTRACT_POOL
+
+
+def _extractors_for_form(form_upper: str) -> frozenset:
+    """Map an (uppercased) SEC form to the extractor set it needs."""
+    for key, wanted in _FORM_EXTRACTORS.items():
+        if key in form_upper:
+            return wanted
+    return _DEFAULT_EXTRACTORS
+
+
+def _extract_bundle(
+    filing_text: str,
+    form: str,
+    keywords: Optional[List[str]]
+) -> Tuple[Dict[str, str], Dict[str, list], Dict[str, Any], List[str]]:
+    """
+    Run all CPU-bound regex extractors for ONE filing.
+
+    Pure text in / plain data out, so it is safe to submit to a
+    ProcessPoolExecutor and gather results across filings in parallel.
+
+    Returns:
+        (sections, financial_metrics, guidance_data, board_nominees)
+    """
+    form_upper = form.upper()
+    wanted = _extractors_for_form(form_upper)
+
+    # Extract sections from THIS filing only
+    sections = {}
+    if 'sections' in wanted:
+        sections = extract_all_sections(filing_text, form, keywords)
+
+    # Metrics + full-text guidance (two independent scans, see extract_all)
+    metrics = {}
+    full_text_guidance = {}
+    if 'metrics' in wanted:
+        metrics, full_text_guidance = extract_all(filing_text)
+
+    # Extract guidance (8-K with at least one trigger keyword)
+    guidance = {}
+    if 'guidance' in wanted and _GUIDANCE_TRIGGER.search(filing_text):
+        # Check guidance_section first
+        if "guidance_section" in sections:
+            guidance = extract_guidance_data(sections["guidance_section"])
+
+        # Fallback to the full-text hits from the fused pass
+        if not guidance:
+            guidance = full_text_guidance
+
+    # Extract board nominees (DEF 14A only)
+    nominees = []
+    if 'nominees' in wanted:
+        # ✅ PERFORMANCE: shrink the data feed, not the scanner. The
+        # nominee table lives in the director-election section of the
+        # proxy, so prefer the already-extracted sections. Only when no
+        # section matched do we scan the whole filing — truncating that
+        # fallback would silently drop nominee tables that sit deep in
+        # a multi-MB proxy.
+        nominee_text = (
+            sections.get('board_nominees')
+            or sections.get('nominee_details')
+            or sections.get('proposal_1')
+            or filing_text
+        )
+        nominees = extract_board_nominees(nominee_text)
+
+    return sections, metrics, guidance, nominees
+
+
 # ════════════════════════════════════════════════════════
 # MAIN SEC SEARCH FUNCTION
 # ════════════════════════════════════════════════════════
@@ -1672,45 +1880,54 @@ async def sec_search_rag(
     except Exception as e:
         return {"error": f"Failed to fetch submissions: {e}"}
 
-    # ✅ PERFORMANCE: Pre-parse date bounds ONCE (not per iteration)
-    start_dt = None
-    end_dt = None
+    # ✅ PERFORMANCE: validate the bounds ONCE, then compare the raw
+    # ISO strings in the loop — "%Y-%m-%d" is lexicographically
+    # sortable, so string compare gives the same ordering as datetime
+    # without allocating a datetime object per filing.
     has_date_filter = start_date or end_date
-    
+
     if has_date_filter:
         try:
             if start_date:
-                start_dt = datetime.strptime(start_date, "%Y-%m-%d")
+                datetime.strptime(start_date, "%Y-%m-%d")
             if end_date:
-                end_dt = datetime.strptime(end_date, "%Y-%m-%d")
+                datetime.strptime(end_date, "%Y-%m-%d")
         except ValueError:
             return {"error": "Invalid date format. Use YYYY-MM-DD"}
         
+    # ✅ PERFORMANCE: uppercase the requested form types ONCE. The
+    # frozenset gives an O(1) exact-match fast path for canonical SEC
+    # form values; the tuple keeps the original permissive substring
+    # fallback (e.g. "10-K" still admits "10-K/A") for the rare miss.
+    form_set = frozenset(ft.upper() for ft in form_types)
+    form_tuple = tuple(form_set)
+
     # Parse recent filings
     recent = data.get("filings", {}).get("recent", {})
     raw_filings = []
-    
+
     for i in range(len(recent.get("form", []))):
-                
+
         form = recent["form"][i]
 
         filing_date = recent["filingDate"][i]
-        
-        # Check form type
-        if not any(ft.upper() in form.upper() for ft in form_types):
+
+        # Check form type (hash hit first, substring scan only on miss)
+        form_u = form.upper()
+        if form_u not in form_set and not any(ft in form_u for ft in form_tuple):
             continue
 
-        # ✅ MAXIMUM PERFORMANCE: Inline date check (no function call)
+        # ✅ MAXIMUM PERFORMANCE: Inline lexicographic date check
+        # (zero allocations — no strptime, no datetime object)
         if has_date_filter:
-            try:
-                filing_dt = datetime.strptime(filing_date, "%Y-%m-%d")
-                
-                if start_dt and filing_dt < start_dt:
-                    continue
-                if end_dt and filing_dt > end_dt:
-                    continue
-            except ValueError:
-                continue  # Skip malformed dates
+            # Skip malformed dates (SEC dates are always YYYY-MM-DD)
+            if len(filing_date) != 10 or filing_date[4] != '-':
+                continue
+
+            if start_date and filing_date < start_date:
+                continue
+            if end_date and filing_date > end_date:
+                continue
 
         # Apend data       
         raw_filings.append({
@@ -1736,7 +1953,9 @@ async def sec_search_rag(
     # STEP 3: Download and extract ALL relevant filings (collect first)
     # ═══════════════════════════════════════════════════════════   
 
-    timeline = []    
+    from llama_index.core import Document  # lazy: not needed by pool workers
+
+    timeline = []
     filings  = []
     rag_docs = []
     all_filings =""
@@ -1851,6 +2070,7 @@ async def sec_search_rag(
 
         try:
             print("[SEC] Initializing LLM/RAG extractor...", file=sys.stderr)
+            from tools.local_llm_rag import QuestionAnsweringExtractor  # lazy: pulls torch
             llm_extractor = QuestionAnsweringExtractor(
                 #model_path="models/llama-3.2-1b-instruct-q4_k_m.gguf",
                 model_path=model_path,
@@ -1952,36 +2172,20 @@ async def sec_search_rag(
     # ═══════════════════════════════════════════════════════════════════
     if not use_local_llm_rag:
         print("[SEC] Using REGEX as extractor...")
-        
-        # ✅ FIX: Process each filing INDIVIDUALLY, not combined text
-        for filing in filings:  # ← Loop through individual filings
-            filing_text = filing["text"]  # ← Use individual filing text
-            filing_form = filing["form"]
-            
-            # Extract sections from THIS filing only
-            sections = extract_all_sections(filing_text, filing_form, keywords)
-            #print("[SEC] after extract_all_sections() ...")
-            
-            # Extract financial data from THIS filing only
-            metrics = extract_financial_data(filing_text)
-            #print("[SEC] extract_financial_data() ...")
-            
-            # Extract guidance (if 8-K)
-            guidance = {}
-            if "8-K" in filing_form.upper():
-                # Check guidance_section first
-                if "guidance_section" in sections:
-                    guidance = extract_guidance_data(sections["guidance_section"])
-                
-                # Fallback to full text of THIS filing
-                if not guidance:
-                    guidance = extract_guidance_data(filing_text)
-            
-            # Extract board nominees (if DEF 14A)
-            nominees = []
-            if "DEF 14A" in filing_form.upper():
-                nominees = extract_board_nominees(filing_text)
-            
+
+        # ✅ PERFORMANCE: regex extraction is pure CPU and independent per
+        # filing, so fan the per-filing bundles out over the shared
+        # process pool instead of blocking the event loop with a serial
+        # scan of each.
+        loop = asyncio.get_running_loop()
+        pool = _get_extract_pool()
+        extract_tasks = [
+            loop.run_in_executor(pool, _extract_bundle, f["text"], f["form"], keywords)
+            for f in filings
+        ]
+        extract_results = await asyncio.gather(*extract_tasks)
+
+        for filing, (sections, metrics, guidance, nominees) in zip(filings, extract_results):
             # ═══════════════════════════════════════════════════════
             # Add to timeline if we found anything
             # ═══════════════════════════════════════════════════════
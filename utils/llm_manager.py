@@ -249,7 +249,7 @@ class LLMManager:
         #    params["response_format"] = {"type": "json_object"}
         print(f"[LLM_MANAGER] _call_llm(): model={model}")
 
-        response = litellm.completion(**params)
+        response = await litellm.acompletion(**params)
         return response
     
     async def _huggingface_completion(
@@ -448,16 +448,19 @@ async def safe_llm_call(
 #---------------------------------------
 async def safe_llm_call(model, messages, api_key=None, **kwargs):
     """
-    Safe wrapper for litellm.completion() that handles errors gracefully.
-    
+    Safe wrapper for litellm.acompletion() that handles errors gracefully.
+
     Returns:
         - Normal response object on success
         - Error dict {"error": "...", "status": "failed"} on failure
     """
     import litellm
-    
+
     try:
-        response = litellm.completion(
+        # ✅ PERFORMANCE: acompletion awaits the LLM round trip instead of
+        # blocking the uvicorn event loop for its whole duration, so the
+        # server keeps handling other requests while the model thinks.
+        response = await litellm.acompletion(
             model=model,
             messages=messages,
             api_key=api_key,